@@ -32,6 +32,7 @@ from typing import (
     Optional,
     Union,
     List,
+    Tuple,
     Sequence,
     Iterator,
     Dict,
@@ -40,12 +41,12 @@ from typing import (
 from typing_extensions import Self
 from oblate.schema import Schema
 from oblate.validate import Validator, ValidatorCallbackT, InputT
-from oblate.utils import MISSING, current_field_key, current_schema
-from oblate.exceptions import FieldError, FrozenError
+from oblate.utils import MISSING, current_field_key, current_schema, shallow_copy
+from oblate.exceptions import FieldError, FieldNotSet, FrozenError
 from oblate.contexts import ErrorContext
 from oblate.configs import config
 
-import copy
+import sys
 
 if TYPE_CHECKING:
     from oblate.contexts import LoadContext, DumpContext
@@ -60,6 +61,7 @@ RawValueT = TypeVar('RawValueT')
 FinalValueT = TypeVar('FinalValueT')
 ValidatorT = Union[Validator[InputT], ValidatorCallbackT[SchemaT, InputT]]
 
+
 class Field(Generic[RawValueT, FinalValueT]):
     """The base class for all fields.
 
@@ -134,6 +136,8 @@ class Field(Generic[RawValueT, FinalValueT]):
         '_raw_validators',
         '_load_key',
         '_dump_key',
+        '_resolved_load_key',
+        '_resolved_dump_key',
     )
 
     def __init__(
@@ -156,10 +160,16 @@ class Field(Generic[RawValueT, FinalValueT]):
         self.extras = extras if extras is not MISSING else {}
         self._load_key = data_key if data_key is not MISSING else load_key
         self._dump_key = data_key if data_key is not MISSING else dump_key
+        self._resolved_load_key = self._load_key
+        self._resolved_dump_key = self._dump_key
         self._default = default
-        self._validators: List[ValidatorT[FinalValueT, Any]] = []
-        self._raw_validators: List[ValidatorT[Any, Any]] = []
-        self._unbind()
+        # Most fields have no validators so the validator lists are only
+        # allocated once a validator is registered. Until then, the shared
+        # empty tuple is used in place of an empty list.
+        self._validators: Union[List[ValidatorT[FinalValueT, Any]], Tuple[()]] = ()
+        self._raw_validators: Union[List[ValidatorT[Any, Any]], Tuple[()]] = ()
+        self._name: str = MISSING
+        self._schema: Type[Schema] = MISSING
 
         if validators is not MISSING:
             for validator in validators:
@@ -177,7 +187,12 @@ class Field(Generic[RawValueT, FinalValueT]):
         if instance is None:
             return self
 
-        return instance.get_value_for(self._name)
+        # Read directly from the field values storage instead of going through
+        # Schema.get_value_for() as this is called on every attribute access.
+        try:
+            return instance._field_values[self._name]
+        except KeyError:
+            raise FieldNotSet(self, instance, self._name) from None
 
     def __set__(self, instance: Schema, value: RawValueT) -> None:
         if instance.__config__.frozen:
@@ -195,10 +210,6 @@ class Field(Generic[RawValueT, FinalValueT]):
             current_schema.reset(schema_token)
             current_field_key.reset(field_name)
 
-    def _unbind(self) -> None:
-        self._name: str = MISSING
-        self._schema: Type[Schema] = MISSING
-
     def _is_bound(self) -> bool:
         return self._name is not MISSING and self._schema is not MISSING
 
@@ -206,22 +217,32 @@ class Field(Generic[RawValueT, FinalValueT]):
         if self._is_bound():
             raise RuntimeError(f"Field {schema.__name__}.{name} is already bound to {self._schema.__name__}.{self._name}")
 
-        self._name = name
+        # The name is used as key for the schema's field values so interning
+        # it allows dictionary lookups to match keys by identity.
+        self._name = sys.intern(name)
         self._schema = schema
-
-    def _run_validators(self, value: Any, context: LoadContext, raw: bool = False) -> List[FieldError]:
+        # The load and dump keys are read on every load and dump, so the
+        # fallback to the field name is resolved once here.
+        if self._load_key is MISSING:
+            self._resolved_load_key = self._name
+        if self._dump_key is MISSING:
+            self._resolved_dump_key = self._name
+
+    def _run_validators(self, value: Any, context: LoadContext, errors: List[FieldError], raw: bool = False) -> None:
+        # The errors are appended directly to the given list (usually the
+        # caller's list of errors) instead of being collected in a new list.
         validators = self._raw_validators if raw else self._validators
-        errors: List[FieldError] = []
+        if not validators:
+            return
 
+        schema = context.schema
         for validator in validators:
             try:
-                validator(context.schema, value, context)
-            except (FieldError, AssertionError, ValueError) as err:
-                if isinstance(err, (AssertionError, ValueError)):
-                    err = FieldError._from_standard_error(err, schema=context.schema, field=self, value=value)
+                validator(schema, value, context)
+            except FieldError as err:
                 errors.append(err)
-
-        return errors
+            except (AssertionError, ValueError) as err:
+                errors.append(FieldError._from_standard_error(err, schema=schema, field=self, value=value))
 
     def _get_default_error_message(self, error_code: str, context: ErrorContext, /) -> Union[FieldError, str]:
         if error_code == self.ERR_VALIDATION_FAILED:
@@ -265,11 +286,11 @@ class Field(Generic[RawValueT, FinalValueT]):
 
     @property
     def load_key(self) -> str:
-        return self._name if self._load_key is MISSING else self._load_key
+        return self._resolved_load_key
 
     @property
     def dump_key(self) -> str:
-        return self._name if self._dump_key is MISSING else self._dump_key
+        return self._resolved_dump_key
 
     @property
     def default(self) -> Any:
@@ -322,10 +343,14 @@ class Field(Generic[RawValueT, FinalValueT]):
         :class:`Field`
             The new field.
         """
-        field = copy.copy(self)
-        field._validators = self._validators.copy()
-        field._raw_validators = self._raw_validators.copy()
-        field._unbind()
+        field = shallow_copy(self)
+        # slicing copies the lists and returns the empty tuples as-is
+        field._validators = self._validators[:]
+        field._raw_validators = self._raw_validators[:]
+        field._name = MISSING
+        field._schema = MISSING
+        field._resolved_load_key = self._load_key
+        field._resolved_dump_key = self._dump_key
         return field
 
     def add_validator(self, validator: ValidatorT[Any, Any], *, raw: bool = False) -> None:
@@ -345,7 +370,16 @@ class Field(Generic[RawValueT, FinalValueT]):
             raise TypeError('validator must be a callable or Validator class instance')  # pragma: no cover
 
         raw = getattr(validator, '__validator_is_raw__', raw)
-        self._raw_validators.append(validator) if raw else self._validators.append(validator)
+        if raw:
+            if self._raw_validators:
+                self._raw_validators.append(validator)
+            else:
+                self._raw_validators = [validator]
+        else:
+            if self._validators:
+                self._validators.append(validator)
+            else:
+                self._validators = [validator]
 
     def remove_validator(self, validator: ValidatorT[Any, Any], *, raw: bool = False) -> None:
         """Removes a validator from this field.
@@ -366,8 +400,11 @@ class Field(Generic[RawValueT, FinalValueT]):
             raise TypeError('validator must be a callable or Validator class instance')  # pragma: no cover
 
         raw = getattr(validator, '__validator_is_raw__', raw)
+        validators = self._raw_validators if raw else self._validators
+        if not validators:
+            return  # pragma: no cover
         try:
-            self._raw_validators.remove(validator) if raw else self._validators.remove(validator)
+            validators.remove(validator)
         except ValueError:  # pragma: no cover
             pass
 
@@ -382,12 +419,12 @@ class Field(Generic[RawValueT, FinalValueT]):
             only non-raw validators are removed.
         """
         if raw is MISSING:
-            self._validators.clear()
-            self._raw_validators.clear()
+            self._validators = ()
+            self._raw_validators = ()
         elif raw:
-            self._raw_validators.clear()
+            self._raw_validators = ()
         else:
-            self._validators.clear()
+            self._validators = ()
 
     def walk_validators(self, *, raw: bool = MISSING) -> Iterator[ValidatorCallbackT[Any, Any]]:
         """Iterates through the validator from this field.
@@ -400,15 +437,13 @@ class Field(Generic[RawValueT, FinalValueT]):
             are iterated  and when False, only non-raw validators are iterated.
         """
         if raw is MISSING:
-            validators = self._validators.copy()
-            validators.extend(self._raw_validators)
+            # A snapshot of both lists is iterated so that validators can
+            # be removed while walking them.
+            yield from (*self._validators, *self._raw_validators)
         elif raw:
-            validators = self._raw_validators
+            yield from self._raw_validators
         else:
-            validators = self._validators
-
-        for validator in validators:
-            yield validator
+            yield from self._validators
 
     def format_error(self, error_code: Any, context: ErrorContext, /) -> Optional[Union[FieldError, str]]:
         """Formats the error.
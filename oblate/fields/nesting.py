@@ -89,6 +89,11 @@ class Object(Field[Union[Mapping[str, Any], SchemaT], SchemaT]):
     """
     ERR_INVALID_DATATYPE = 'object.invalid_datatype'
 
+    __slots__ = (
+        'schema_cls',
+        'init_kwargs',
+    )
+
     def __init__(self, schema_cls: Type[SchemaT], *, init_kwargs: Mapping[str, Any] = MISSING, **kwargs: Any):
         if not issubclass(schema_cls, Schema):
             raise TypeError('schema_cls must be a subclass of Schema')  # pragma: no cover
@@ -104,15 +109,19 @@ class Object(Field[Union[Mapping[str, Any], SchemaT], SchemaT]):
         return super()._get_default_error_message(error_code, context)  # pragma: no cover
 
     def value_load(self, value: Union[Mapping[str, Any], SchemaT], context: LoadContext) -> SchemaT:
-        if isinstance(value, self.schema_cls):
-            return value
-        if isinstance(value, collections.abc.Mapping):
-            try:
-                return self.schema_cls(value, **self.init_kwargs)
-            except ValidationError as err:
-                raise FieldError(err._raw_std(include_message=False)) from None
-
-        raise self._call_format_error(self.ERR_INVALID_DATATYPE, context.schema, value)
+        schema_cls = self.schema_cls
+        # Raw data is a dict in most cases (e.g. parsed JSON) so the
+        # schema instance and (slower) Mapping ABC checks are skipped for it.
+        if not isinstance(value, dict):
+            if type(value) is schema_cls or isinstance(value, schema_cls):
+                return value
+            if not isinstance(value, collections.abc.Mapping):
+                raise self._call_format_error(self.ERR_INVALID_DATATYPE, context.schema, value)
+
+        try:
+            return schema_cls(value, **self.init_kwargs)
+        except ValidationError as err:
+            raise FieldError(err._raw_std(include_message=False)) from None
 
     def value_dump(self, value: SchemaT, context: DumpContext) -> Mapping[str, Any]:
         return value.dump()
@@ -22,7 +22,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Union
 from oblate.fields.base import Field
 from oblate.exceptions import FieldError
 
@@ -58,26 +58,28 @@ class String(Field[str, str]):
     """
     ERR_INVALID_DATATYPE = 'string.invalid_datatype'
 
+    __slots__ = (
+        'strict',
+    )
+
     def __init__(self, strict: bool = True, **kwargs: Any) -> None:
         self.strict = strict
         super().__init__(**kwargs)
 
-    def _process_value(self, value: Any, ctx: LoadContext) -> str:
-        if not isinstance(value, str):
-            if self.strict:
-                raise self._call_format_error(self.ERR_INVALID_DATATYPE, ctx.schema, value)
-            return str(value)
-        else:
-            return value
-
     def _get_default_error_message(self, error_code: Any, context: ErrorContext) -> Union[FieldError, str]:
         if error_code == self.ERR_INVALID_DATATYPE:
             return 'Value must be a string'
 
         return super()._get_default_error_message(error_code, context)
 
-    def value_load(self, value: str, context: LoadContext) -> str:
-        return self._process_value(context.value, context)
+    def value_load(self, value: Any, context: LoadContext) -> str:
+        if type(value) is str:
+            return value
+        if isinstance(value, str):
+            return value
+        if self.strict:
+            raise self._call_format_error(self.ERR_INVALID_DATATYPE, context.schema, value)
+        return str(value)
 
     def value_dump(self, value: str, context: DumpContext) -> str:
         return value
@@ -106,21 +108,14 @@ class Integer(Field[int, int]):
     ERR_INVALID_DATATYPE = 'integer.invalid_datatype'
     ERR_COERCION_FAILED  = 'integer.coercion_failed'
 
+    __slots__ = (
+        'strict',
+    )
+
     def __init__(self, strict: bool = True, **kwargs: Any) -> None:
         self.strict = strict
         super().__init__(**kwargs)
 
-    def _process_value(self, value: Any, ctx: LoadContext) -> int:
-        if not isinstance(value, int):
-            if self.strict:
-                raise self._call_format_error(self.ERR_INVALID_DATATYPE, ctx.schema, value)
-            try:
-                return int(value)
-            except Exception:
-                raise self._call_format_error(self.ERR_COERCION_FAILED, ctx.schema, value) from None
-        else:
-            return value
-
     def _get_default_error_message(self, error_code: Any, context: ErrorContext) -> Union[FieldError, str]:
         if error_code == self.ERR_INVALID_DATATYPE:
             return 'Value must be an integer'
@@ -129,8 +124,18 @@ class Integer(Field[int, int]):
 
         return super()._get_default_error_message(error_code, context)
 
-    def value_load(self, value: int, context: LoadContext) -> int:
-        return self._process_value(context.value, context)
+    def value_load(self, value: Any, context: LoadContext) -> int:
+        if type(value) is int:
+            return value
+        # bool is a subclass of int but booleans are not valid integers
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if self.strict:
+            raise self._call_format_error(self.ERR_INVALID_DATATYPE, context.schema, value)
+        try:
+            return int(value)
+        except Exception:
+            raise self._call_format_error(self.ERR_COERCION_FAILED, context.schema, value) from None
 
     def value_dump(self, value: int, context: DumpContext) -> int:
         return value
@@ -180,6 +185,11 @@ class Boolean(Field[bool, bool]):
     ERR_INVALID_DATATYPE = 'boolean.invalid_datatype'
     ERR_COERCION_FAILED  = 'boolean.coercion_failed'
 
+    __slots__ = (
+        'strict',
+        '_values_map',
+    )
+
     def __init__(
             self,
             *,
@@ -192,22 +202,16 @@ class Boolean(Field[bool, bool]):
         super().__init__(**kwargs)
 
         self.strict = strict
-        self._true_values = true_values if true_values is not None else self.TRUE_VALUES
-        self._false_values = false_values if false_values is not None else self.FALSE_VALUES
 
-    def _process_value(self, value: Any, ctx: LoadContext) -> bool:
-        if not isinstance(value, bool):
-            if self.strict:
-                raise self._call_format_error(self.ERR_INVALID_DATATYPE, ctx.schema, value)
-            value = str(value)
-            if value in self._true_values:
-                return True
-            if value in self._false_values:
-                return False
-            else:
-                raise self._call_format_error(self.ERR_COERCION_FAILED, ctx.schema, value)
-        else:
-            return value
+        if true_values is None:
+            true_values = self.TRUE_VALUES
+        if false_values is None:
+            false_values = self.FALSE_VALUES
+
+        # Both true and false values are resolved using a single lookup. True
+        # values are added last so they take precedence in case of overlap.
+        self._values_map: Dict[str, bool] = dict.fromkeys(false_values, False)
+        self._values_map.update(dict.fromkeys(true_values, True))
 
     def _get_default_error_message(self, error_code: Any, context: ErrorContext) -> Union[FieldError, str]:
         if error_code == self.ERR_INVALID_DATATYPE:
@@ -217,8 +221,20 @@ class Boolean(Field[bool, bool]):
 
         return super()._get_default_error_message(error_code, context)  # pragma: no cover
 
-    def value_load(self, value: bool, context: LoadContext) -> bool:
-        return self._process_value(context.value, context)
+    def value_load(self, value: Any, context: LoadContext) -> bool:
+        # True and False are singletons so an identity check is
+        # sufficient (and cheaper) to detect boolean values.
+        if value is True or value is False:
+            return value
+        if self.strict:
+            raise self._call_format_error(self.ERR_INVALID_DATATYPE, context.schema, value)
+
+        if type(value) is not str:
+            value = str(value)
+        result = self._values_map.get(value)
+        if result is None:
+            raise self._call_format_error(self.ERR_COERCION_FAILED, context.schema, value)
+        return result
 
     def value_dump(self, value: bool, context: DumpContext) -> bool:
         return value
@@ -247,21 +263,14 @@ class Float(Field[float, float]):
     ERR_INVALID_DATATYPE = 'float.invalid_datatype'
     ERR_COERCION_FAILED  = 'float.coercion_failed'
 
+    __slots__ = (
+        'strict',
+    )
+
     def __init__(self, strict: bool = True, **kwargs: Any) -> None:
         self.strict = strict
         super().__init__(**kwargs)
 
-    def _process_value(self, value: Any, ctx: LoadContext) -> float:
-        if not isinstance(value, float):
-            if self.strict:
-                raise self._call_format_error(self.ERR_INVALID_DATATYPE, ctx.schema, value)
-            try:
-                return float(value)
-            except Exception:
-                raise self._call_format_error(self.ERR_COERCION_FAILED, ctx.schema, value) from None
-        else:
-            return value
-
     def _get_default_error_message(self, error_code: Any, context: ErrorContext) -> Union[FieldError, str]:
         if error_code == self.ERR_INVALID_DATATYPE:
             return 'Value must be a floating point number'
@@ -270,8 +279,17 @@ class Float(Field[float, float]):
 
         return super()._get_default_error_message(error_code, context)  # pragma: no cover
 
-    def value_load(self, value: float, context: LoadContext) -> float:
-        return self._process_value(context.value, context)
+    def value_load(self, value: Any, context: LoadContext) -> float:
+        if type(value) is float:
+            return value
+        if isinstance(value, float):
+            return value
+        if self.strict:
+            raise self._call_format_error(self.ERR_INVALID_DATATYPE, context.schema, value)
+        try:
+            return float(value)
+        except Exception:
+            raise self._call_format_error(self.ERR_COERCION_FAILED, context.schema, value) from None
 
     def value_dump(self, value: float, context: DumpContext) -> float:
         return value
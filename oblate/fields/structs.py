@@ -60,10 +60,16 @@ class _BaseStructField(Field[KT, VT]):
     ERR_INVALID_DATATYPE = 'struct.invalid_datatype'
     ERR_TYPE_VALIDATION_FAILED = 'struct.type_validation_failed'
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        self.ERR_INVALID_DATATYPE = f'{self._struct_name}.invalid_datatype'  # type: ignore
-        self.ERR_TYPE_VALIDATION_FAILED = f'{self._struct_name}.type_validation_failed'  # type: ignore
-        super().__init__(*args, **kwargs)
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # Error codes are resolved once per struct class rather than being
+        # set on each field instance.
+        if '_struct_name' in cls.__dict__:
+            cls.ERR_INVALID_DATATYPE = f'{cls._struct_name}.invalid_datatype'  # type: ignore
+            cls.ERR_TYPE_VALIDATION_FAILED = f'{cls._struct_name}.type_validation_failed'  # type: ignore
 
     def _get_default_error_message(self, error_code: Any, context: ErrorContext) -> Union[FieldError, str]:
         if error_code == self.ERR_INVALID_DATATYPE:
@@ -109,6 +115,12 @@ class Dict(_BaseStructField[DictT[KT, VT], DictT[KT, VT]]):
     _struct_name = 'dict'
     _friendly_struct_name = 'dictionary'
 
+    __slots__ = (
+        'key_tp',
+        'value_tp',
+        '_tp',
+    )
+
     def __init__(self, key_tp: Type[KT] = MISSING, value_tp: Type[VT] = MISSING, /, **kwargs: Any) -> None:
         self.key_tp = key_tp
         self.value_tp = value_tp
@@ -161,6 +173,11 @@ class TypedDict(_BaseStructField[TD, TD]):
     _struct_name = 'typed_dict'
     _friendly_struct_name = 'dictionary'
 
+    __slots__ = (
+        'typed_dict',
+        '_validator',
+    )
+
     def __init__(self, typed_dict: Type[TD], /, **kwargs: Any):
         self.typed_dict = typed_dict
         self._validator = TypeValidator({'root': typed_dict})
@@ -204,6 +221,11 @@ class List(_BaseStructField[ListT[KT], ListT[KT]]):
     _struct_name = 'list'
     _friendly_struct_name = 'list'
 
+    __slots__ = (
+        'type',
+        '_tp',
+    )
+
     def __init__(self, type: Type[KT] = MISSING, /, **kwargs: Any):
         self.type = type
         self._tp = None if type is MISSING else TypeValidator({'root': ListT[type]})
@@ -246,6 +268,11 @@ class Set(_BaseStructField[SetT[KT], SetT[KT]]):
     _struct_name = 'set'
     _friendly_struct_name = 'set'
 
+    __slots__ = (
+        'type',
+        '_tp',
+    )
+
     def __init__(self, type: Type[KT] = MISSING, /, **kwargs: Any):
         self.type = type
         self._tp = None if type is MISSING else TypeValidator({'root': SetT[type]})
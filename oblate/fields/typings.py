@@ -54,6 +54,8 @@ class Any(Field[t.Any, t.Any]):
     This field acts as a "raw field" that performs no validation on the
     given value.
     """
+    __slots__ = ()
+
     def value_load(self, value: Any, context: LoadContext) -> Any:
         return value
 
@@ -80,6 +82,11 @@ class Literal(Field[_T, _T]):
     """
     ERR_INVALID_VALUE = 'literal.invalid_value'
 
+    __slots__ = (
+        'values',
+        '_tp',
+    )
+
     def __init__(self, *values: _T, **kwargs: t.Any) -> None:
         self.values = values
         self._tp = TypeValidator({'root': _generic_type_with_args(t.Literal, values)})
@@ -122,6 +129,11 @@ class Union(Field[_T, _T]):
     """
     ERR_INVALID_VALUE = 'union.invalid_value'
 
+    __slots__ = (
+        'types',
+        '_tp',
+    )
+
     def __init__(self, *types: t.Type[_T], **kwargs: t.Any):
         if len(types) < 2:
             raise TypeError('fields.Union() accepts at least two arguments')  # pragma: no cover
@@ -173,6 +185,11 @@ class TypeExpr(Field[_T, _T]):
     """
     ERR_TYPE_VALIDATION_FAILED = 'type_expr.type_validation_failed'
 
+    __slots__ = (
+        'expr',
+        '_tp',
+    )
+
     def __init__(self, expr: t.Type[_T], **kwargs: t.Any):
         self.expr = expr
         self._tp = TypeValidator({'root': expr})
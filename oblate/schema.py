@@ -36,13 +36,12 @@ from typing import (
 )
 from typing_extensions import Self
 from oblate.contexts import SchemaContext, LoadContext, DumpContext
-from oblate.utils import MISSING, current_field_key, current_context, current_schema
+from oblate.utils import MISSING, current_field_key, current_context, current_schema, shallow_copy
 from oblate.exceptions import FieldError, FieldNotSet, FrozenError
 from oblate.configs import config, SchemaConfig
 
 import collections.abc
 import inspect
-import copy
 
 if TYPE_CHECKING:
     from oblate.fields.base import Field
@@ -122,7 +121,8 @@ class Schema(metaclass=_SchemaMeta):
             ignore_extra: bool = MISSING,
         ):
 
-        if not isinstance(data, collections.abc.Mapping):
+        # dict is checked first to avoid the slower Mapping ABC check in most cases.
+        if not isinstance(data, dict) and not isinstance(data, collections.abc.Mapping):
             raise TypeError(f'data must be a mapping, not {type(data)}')
 
         token = current_schema.set(self)
@@ -169,7 +169,7 @@ class Schema(metaclass=_SchemaMeta):
 
     def _prepare_from_data(self, data: Mapping[str, Any], *, ignore_extra: bool = MISSING) -> None:
         data = self.preprocess_data(data)
-        if not isinstance(data, collections.abc.Mapping):
+        if not isinstance(data, dict) and not isinstance(data, collections.abc.Mapping):
             raise TypeError(f'{self.__class__.__qualname__}.preprocess_data must return a ' \
                             f'mapping, not {type(data)}')
 
@@ -206,15 +206,20 @@ class Schema(metaclass=_SchemaMeta):
             finally:
                 current_field_key.reset(token)
 
-        for field, value, context, raw in validators:
-            ctx_token = current_context.set(context)
-            field_token = current_field_key.set(field.load_key)
+        if validators:
+            # The current schema is the same for all validators so it
+            # is only set once rather than for each validator.
             schema_token = current_schema.set(self)
             try:
-                errors.extend(field._run_validators(value, context, raw=raw))
+                for field, value, context, raw in validators:
+                    ctx_token = current_context.set(context)
+                    field_token = current_field_key.set(field.load_key)
+                    try:
+                        field._run_validators(value, context, errors, raw=raw)
+                    finally:
+                        current_context.reset(ctx_token)
+                        current_field_key.reset(field_token)
             finally:
-                current_context.reset(ctx_token)
-                current_field_key.reset(field_token)
                 current_schema.reset(schema_token)
 
         if errors:
@@ -262,19 +267,22 @@ class Schema(metaclass=_SchemaMeta):
                 errors.append(field._call_format_error(field.ERR_NONE_DISALLOWED, self, None))
             return errors
 
-        if not lazy_validation:
-            validator_errors.extend(field._run_validators(value, context, raw=True))
+        # Validators are only ran (or queued) when the field has any so
+        # the common case of fields without validators skips this work.
+        if field._raw_validators and not lazy_validation:
+            field._run_validators(value, context, validator_errors, raw=True)
         try:
             final_value = field.value_load(value, context)
-        except (ValueError, AssertionError, FieldError) as err:
-            if not isinstance(err, FieldError):
-                err = FieldError._from_standard_error(err, schema=self, field=field, value=value)
+        except FieldError as err:
             errors.append(err)
+        except (ValueError, AssertionError) as err:
+            errors.append(FieldError._from_standard_error(err, schema=self, field=field, value=value))
         else:
-            if not lazy_validation:
-                validator_errors.extend(field._run_validators(final_value, context, raw=False))
-            else:
-                validators.append((field, final_value, context, False))
+            if field._validators:
+                if not lazy_validation:
+                    field._run_validators(final_value, context, validator_errors, raw=False)
+                else:
+                    validators.append((field, final_value, context, False))
             if not validator_errors:
                 self._field_values[name] = final_value
             errors.extend(validator_errors)
@@ -344,7 +352,7 @@ class Schema(metaclass=_SchemaMeta):
         :class:`Schema`
             The copied schema instance.
         """
-        schema = copy.copy(self)
+        schema = shallow_copy(self)
         schema._field_values = self._field_values.copy()
         schema._context = self._context._copy(schema=schema)
         return schema
@@ -374,6 +382,13 @@ class Schema(metaclass=_SchemaMeta):
         FieldNotSet
             Field value is not set.
         """
+        # Values are stored by field name so when the given name is a field
+        # name with a value set, it can be returned without resolving the field.
+        try:
+            return self._field_values[field_name]
+        except KeyError:
+            pass
+
         field = self._get_field(field_name)
         try:
             return self._field_values[field._name]
@@ -489,10 +504,10 @@ class Schema(metaclass=_SchemaMeta):
             context_token = current_context.set(context)
             try:
                 out[field.dump_key] = field.value_dump(value, context)
-            except (ValueError, AssertionError, FieldError) as err:
-                if not isinstance(err, FieldError):
-                    err = FieldError._from_standard_error(err, schema=self, field=field, value=value)
+            except FieldError as err:
                 errors.append(err)
+            except (ValueError, AssertionError) as err:
+                errors.append(FieldError._from_standard_error(err, schema=self, field=field, value=value))
             finally:
                 current_field_key.reset(field_token)
                 current_context.reset(context_token)
@@ -22,9 +22,13 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List, Tuple, TypeVar
 from contextvars import ContextVar
 
+import copy
+import copyreg
+import weakref
+
 if TYPE_CHECKING:
     from oblate.contexts import _BaseValueContext
     from oblate.schema import Schema
@@ -35,8 +39,11 @@ __all__ = (
     'current_context',
     'current_field_key',
     'current_schema',
+    'shallow_copy',
 )
 
+T = TypeVar('T')
+
 
 class MissingType:
     """Type for representing unaltered/default/missing values.
@@ -54,6 +61,94 @@ class MissingType:
 MISSING: Any = MissingType()
 
 
+# Cache of slot names per class. Weak references are used so that
+# dynamically created classes (e.g. schemas) can still be garbage collected.
+_slots_cache: weakref.WeakKeyDictionary[type, Tuple[str, ...]] = weakref.WeakKeyDictionary()
+
+
+def _get_slots(cls: type) -> Tuple[str, ...]:
+    # Returns the names of all slots defined in the class hierarchy
+    try:
+        return _slots_cache[cls]
+    except KeyError:
+        pass
+
+    slots: List[str] = []
+    for klass in cls.__mro__:
+        names = klass.__dict__.get('__slots__', ())
+        if isinstance(names, str):
+            names = (names,)
+        for name in names:
+            if name in ('__dict__', '__weakref__'):
+                continue
+            if name.startswith('__') and not name.endswith('__'):
+                name = f'_{klass.__name__.lstrip("_")}{name}'
+            slots.append(name)
+
+    result = _slots_cache[cls] = tuple(slots)
+    return result
+
+
+# The hooks through which copy.copy() allows customizing copying.
+_COPY_HOOKS = (
+    '__copy__',
+    '__reduce_ex__',
+    '__reduce__',
+    '__getnewargs_ex__',
+    '__getnewargs__',
+    '__getstate__',
+    '__setstate__',
+)
+
+_copy_hooks_cache: weakref.WeakKeyDictionary[type, bool] = weakref.WeakKeyDictionary()
+
+
+def _has_copy_hooks(cls: type) -> bool:
+    # Returns whether the class overrides any of the copy protocol hooks
+    try:
+        return _copy_hooks_cache[cls]
+    except KeyError:
+        pass
+
+    result = _copy_hooks_cache[cls] = any(
+        getattr(cls, name, None) is not getattr(object, name, None)
+        for name in _COPY_HOOKS
+    )
+    return result
+
+
+def shallow_copy(obj: T) -> T:
+    """Creates a shallow copy of the given object.
+
+    This is a faster alternative to :func:`copy.copy` for the classes
+    defined by the library. The attributes (slots and instance dictionary)
+    are copied directly without going through the ``__reduce_ex__`` protocol.
+
+    If the object's class defines any of the copy protocol hooks (such as
+    ``__copy__``, ``__reduce_ex__`` or ``__getnewargs__``) or is registered
+    in :data:`copyreg.dispatch_table`, :func:`copy.copy` is used instead so
+    that the custom copying behaviour is respected.
+    """
+    cls = obj.__class__
+    # dispatch_table is not cached as classes can be registered at any time.
+    if _has_copy_hooks(cls) or cls in copyreg.dispatch_table:
+        return copy.copy(obj)
+
+    new = cls.__new__(cls)
+    for name in _get_slots(cls):
+        try:
+            setattr(new, name, getattr(obj, name))
+        except AttributeError:
+            # slot has no value set
+            pass
+    try:
+        new.__dict__.update(obj.__dict__)
+    except AttributeError:
+        pass
+
+    return new
+
+
 ### Context variables ###
 
 current_context: ContextVar[_BaseValueContext] = ContextVar('current_context')
@@ -25,6 +25,7 @@ from __future__ import annotations
 from oblate import fields
 import oblate
 import pytest
+import types
 
 def test_field_object():
     class User(oblate.Schema):
@@ -62,6 +63,9 @@ def test_field_object():
 
     assert game.author == user
 
+    game = Game({'id': 1, 'author': types.MappingProxyType({'id': 1, 'name': 'John'})})
+    assert game.author.name == 'John'
+
 def test_field_object_init_kwargs():
     class User(oblate.Schema):
         id = fields.Integer()
@@ -77,6 +77,23 @@ def test_integer_strictness():
             'boolean': True,
         })
 
+def test_integer_rejects_boolean():
+    with pytest.raises(oblate.ValidationError, match='Value must be an integer'):
+        _TestSchemaStrict({
+            'string': 'test',
+            'integer': True,
+            'float_': 3.14,
+            'boolean': True,
+        })
+
+    nostrict = _TestSchemaNoStrict({
+        'string': 'test',
+        'integer': True,
+        'float_': 3.14,
+        'boolean': True,
+    })
+    assert type(nostrict.integer) is int and nostrict.integer == 1
+
 def test_float_strictness():
     with pytest.raises(oblate.ValidationError, match="Failed to coerce 'bad float' to float"):
         _TestSchemaNoStrict({
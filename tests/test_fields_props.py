@@ -22,9 +22,11 @@
 
 from __future__ import annotations
 
+from typing import Any
 from oblate import fields
 import oblate
 import pytest
+import copyreg
 
 def test_nullable_fields():
     class _TestSchema(oblate.Schema):
@@ -79,6 +81,92 @@ def test_field_copying():
 
     assert _TestSchemaNew({'id': '1234'}).id == 1234
 
+    class _TestSchemaRenamed(oblate.Schema):
+        user_id = _TestSchema.id.copy()
+
+    assert _TestSchemaRenamed.user_id.load_key == 'user_id'
+    assert _TestSchemaRenamed({'user_id': '1234'}).dump() == {'user_id': 1234}
+
+def test_field_copying_custom_copy():
+    class _CustomString(fields.String):
+        def __copy__(self):
+            field = _CustomString(strict=self.strict)
+            field.extras['copied'] = True
+            return field
+
+    class _TestSchema(oblate.Schema):
+        name = _CustomString(strict=False)
+
+    field = _TestSchema.name.copy()
+
+    assert isinstance(field, _CustomString)
+    assert field.extras == {'copied': True}
+    assert not field.strict
+
+def test_field_copying_copy_protocol():
+    class _TaggedString(fields.String):
+        def __new__(cls, tag: str, **kwargs: Any):
+            return super().__new__(cls)
+
+        def __init__(self, tag: str, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+            self.tag = tag
+
+        def __getnewargs__(self):
+            return (self.tag,)
+
+    field = _TaggedString('tag', strict=False)
+    new = field.copy()
+
+    assert isinstance(new, _TaggedString)
+    assert new.tag == 'tag'
+    assert not new.strict
+
+    class _RegisteredString(fields.String):
+        pass
+
+    def _reduce(field: _RegisteredString):
+        new = _RegisteredString(strict=field.strict)
+        new.extras['registered'] = True
+        return (lambda: new, ())
+
+    copyreg.pickle(_RegisteredString, _reduce)
+    try:
+        registered = _RegisteredString(strict=False).copy()
+    finally:
+        del copyreg.dispatch_table[_RegisteredString]
+
+    assert isinstance(registered, _RegisteredString)
+    assert registered.extras == {'registered': True}
+    assert not registered.strict
+
+def test_field_copying_slots():
+    class _PrivateField(fields.String):
+        __slots__ = ('__private', '__dict__')
+
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+            self.__private = 'private'
+
+        def get_private(self) -> str:
+            return self.__private
+
+    class _SingleSlotField(fields.String):
+        __slots__ = 'single'
+
+    field = _PrivateField()
+    field.attr = 'value'  # type: ignore
+    new = field.copy()
+
+    assert new.get_private() == 'private'  # type: ignore
+    assert new.attr == 'value'  # type: ignore
+
+    field = _SingleSlotField()
+    assert not hasattr(field.copy(), 'single')
+
+    field.single = 'value'
+    assert field.copy().single == 'value'  # type: ignore
+
 def test_field_data_keys():
     class _TestSchema(oblate.Schema):
         id = fields.Integer(data_key='Id')
@@ -172,6 +172,23 @@ def test_copy():
     assert schema.context.state['test'] == '1'
     assert new.context.state == None
 
+def test_copy_custom_copy():
+    calls = []
+
+    class _TestSchema(oblate.Schema):
+        one = fields.String()
+
+        def __copy__(self):
+            calls.append(self)
+            return self.__class__.__new__(self.__class__)
+
+    schema = _TestSchema({'one': '1'})
+    new = schema.copy()
+
+    assert calls == [schema]
+    assert new.one == '1'
+    assert new is not schema
+
 def test_preprocess_data():
     class _TestSchema(oblate.Schema):
         name = fields.String()
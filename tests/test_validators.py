@@ -79,6 +79,33 @@ def test_raw_validator():
     with pytest.raises(oblate.ValidationError, match='in range 1000-9999'):
         User({'id': 320})
 
+def test_validators_on_assignment():
+    class _TestSchema(oblate.Schema):
+        id = fields.Integer(strict=False)
+
+        @validate.field('id', raw=True)
+        def validate_raw_id(self, value: Any, context: oblate.LoadContext):
+            if isinstance(value, float):
+                raise ValueError('Value must not be a float')
+
+        @validate.field('id', raw=False)
+        def validate_id(self, value: int, context: oblate.LoadContext):
+            if not (value >= 1000 and value <= 9999):
+                raise ValueError('Value must be in range 1000-9999')
+
+    schema = _TestSchema({'id': 3210})
+
+    with pytest.raises(oblate.ValidationError, match='must not be a float'):
+        schema.id = 4321.0
+
+    with pytest.raises(oblate.ValidationError, match='in range 1000-9999'):
+        schema.id = 320
+
+    assert schema.id == 3210
+
+    schema.id = '4321'  # type: ignore
+    assert schema.id == 4321
+
 def test_validators_methods():
     assert list(User.id.walk_validators()) == [User.validate_id, User.validate_raw_id]
     assert list(User.id.walk_validators(raw=True)) == [User.validate_raw_id]
@@ -105,6 +132,13 @@ def test_validators_methods():
     User.id.clear_validators()
     assert list(User.id.walk_validators()) == []
 
+    User.id.add_validator(range_validator)
+    User.id.add_validator(User.validate_id)
+    User.id.add_validator(User.validate_raw_id)
+    for validator in User.id.walk_validators():
+        User.id.remove_validator(validator)
+    assert list(User.id.walk_validators()) == []
+
 
 def test_validators_range():
     msg = 'Value must be in range {lb} to {ub} inclusive'